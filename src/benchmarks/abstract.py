@@ -1,11 +1,37 @@
 import csv
+import gc
+import itertools
+import os
 import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Generic, Iterable, Tuple, TypeVar
+from pathlib import Path
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from numpy import dtype
 
+try:
+    import pyarrow as _pa
+    import pyarrow.parquet as _pq
+except ImportError:
+    _pyarrow_installed = False
+    _pa = None
+    _pq = None
+else:
+    _pyarrow_installed = True
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -70,6 +96,76 @@ class AbstractArrayInfo(ABC, Generic[_T]):
         )
 
 
+def _parse_cpu_list(cpu_list: str) -> Set[int]:
+    cpus: Set[int] = set()
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _read_sysfs(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="UTF-8").strip()
+    except OSError:
+        return None
+
+
+def _performance_cpus(allowed: Set[int]) -> Set[int]:
+    hybrid_cores = _read_sysfs(Path("/sys/devices/cpu_core/cpus"))
+    if hybrid_cores:
+        performance = _parse_cpu_list(hybrid_cores) & allowed
+        if performance:
+            return performance
+    sysfs = Path("/sys/devices/system/cpu")
+    for attribute in ("cpu_capacity", "cpufreq/cpuinfo_max_freq"):
+        ratings = {}
+        for cpu in allowed:
+            rating = _read_sysfs(sysfs / f"cpu{cpu}" / attribute)
+            if rating is not None:
+                ratings[cpu] = int(rating)
+        if len(ratings) == len(allowed):
+            best = max(ratings.values())
+            return {cpu for cpu, rating in ratings.items() if rating == best}
+    return allowed
+
+
+def pin_cpu(cpu: Optional[int] = None) -> Optional[int]:
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    if cpu is None:
+        cpu = max(_performance_cpus(os.sched_getaffinity(0)))
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+
+def run_benchmark(
+    func: Callable[[], Any], repeat: int, number: int
+) -> List[float]:
+    gc_enabled = gc.isenabled()
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = perf_counter_ns()
+            for _ in itertools.repeat(None, number):
+                func()
+            stop = perf_counter_ns()
+        finally:
+            if gc_enabled:
+                gc.enable()
+        timings.append((stop - start) / 1e9)
+    return timings
+
+
+def _output_name(filename: str, extension: str) -> str:
+    timestr = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return f"{filename}_{timestr}.{extension}"
+
+
 def csv_writer(
     filename: str,
     header: Iterable[Any],
@@ -78,17 +174,51 @@ def csv_writer(
     quotechar: str = '"',
     quoting: int = csv.QUOTE_MINIMAL,
 ) -> None:
-    timestr = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     if delimiter == "\t":
-        extension = ".tsv"
+        extension = "tsv"
     elif delimiter == ",":
-        extension = ".csv"
+        extension = "csv"
     else:
-        extension = ".txt"
-    output_name = f"{filename}_{timestr}.{extension}"
+        extension = "txt"
+    output_name = _output_name(filename, extension)
     with open(output_name, "w", encoding="UTF-8", newline="") as file:
         writer = csv.writer(
             file, delimiter=delimiter, quotechar=quotechar, quoting=quoting
         )
         writer.writerow(header)
-        writer.writerows(data)
+        for row in data:
+            writer.writerow(row)
+            file.flush()
+
+
+def parquet_writer(
+    filename: str,
+    header: Iterable[Any],
+    data: Iterable[Any],
+    compression: str = "zstd",
+) -> None:
+    if not _pyarrow_installed:
+        raise ImportError("Writing Parquet files requires pyarrow")
+    columns: Dict[Any, List[Any]] = {name: [] for name in header}
+    for row in data:
+        if len(row) != len(columns):
+            raise ValueError(
+                f"Row has {len(row)} values but the header has {len(columns)}"
+            )
+        for values, value in zip(columns.values(), row):
+            values.append(str(value) if isinstance(value, dtype) else value)
+    table = _pa.Table.from_pydict(columns)
+    output_name = _output_name(filename, "parquet")
+    _pq.write_table(table, output_name, compression=compression)
+
+
+def write_results(
+    filename: str,
+    header: Iterable[Any],
+    data: Iterable[Any],
+    parquet: bool = False,
+) -> None:
+    if parquet:
+        parquet_writer(filename, header, data)
+    else:
+        csv_writer(filename, header, data)
@@ -1,6 +1,6 @@
 import sys
-from timeit import Timer
-from typing import Any
+from functools import partial
+from typing import Any, Iterator, Sequence, Tuple
 
 from numpy import arange, count_nonzero, dtype
 from numpy.random import default_rng
@@ -14,7 +14,8 @@ else:
 from benchmarks.abstract import (
     _T,
     AbstractArrayInfo,
-    csv_writer,
+    run_benchmark,
+    write_results,
 )
 
 
@@ -44,40 +45,49 @@ class ArrayInfo(AbstractArrayInfo[NDArray[Any]]):
         return count_nonzero(array)
 
 
-def benchmark_size_2d():
-    shapes = range(1024, 4096 + 1, 64)
-    iterations = 20
-    repeats = 10
-    setup = "import numpy as np; array = np.random.default_rng(1).random(({shape}, {shape}), 'float64')"
-    stmt = "array.dot(array)"
-    data = []
+def _size_2d(
+    shapes: Sequence[int], repeats: int, iterations: int
+) -> Iterator[Tuple[Any, ...]]:
     for shape in shapes:
-        timer = Timer(stmt, setup.format(shape=shape))
-        timings = timer.repeat(number=iterations, repeat=repeats)
         array = default_rng(1).random((shape, shape), "float64")
-        data.append((*ArrayInfo.as_tuple(array), *timings))
+        timings = run_benchmark(
+            partial(array.dot, array), repeat=repeats, number=iterations
+        )
+        yield (*ArrayInfo.as_tuple(array), *timings)
         print(f"Shape {shape} of {shapes[-1]}")
+
+
+def benchmark_size_2d(parquet: bool = False) -> None:
+    shapes = range(1024, 4096 + 1, 64)
+    iterations = 20
+    repeats = 10
     head = [f"run_{run:02}" for run in range(1, repeats + 1)]
     header = [*ArrayInfo.header(), *head]
-    csv_writer("benchmark_numpy_size_2d", header, data)
+    data = _size_2d(shapes, repeats, iterations)
+    write_results("benchmark_numpy_size_2d", header, data, parquet=parquet)
 
 
-def benchmark_sparsity_2d():
-    shape = 2048
-    sparsity = arange(0, 1, 0.1)
-    setup = "import numpy as np; array = np.random.default_rng(1).random(({shape}, {shape}), 'float64'); array[array < {sparse}] = 0"
-    stmt = "array.dot(array)"
-    data = []
+def _sparsity_2d(
+    shape: int, sparsity: Sequence[float], repeats: int, iterations: int
+) -> Iterator[Tuple[Any, ...]]:
+    source = default_rng(1).random((shape, shape), "float64")
     for sparse in sparsity:
-        timer = Timer(stmt, setup.format(shape=shape, sparse=sparse))
-        timings = timer.repeat(repeat=10, number=20)
-        array = default_rng(1).random((shape, shape), "float64")
+        array = source.copy()
         array[array < sparse] = 0
-        data.append((*ArrayInfo.as_tuple(array), *timings))
+        timings = run_benchmark(
+            partial(array.dot, array), repeat=repeats, number=iterations
+        )
+        yield (*ArrayInfo.as_tuple(array), *timings)
         print(f"Sparsity {sparse} of {sparsity[-1]}")
+
+
+def benchmark_sparsity_2d(parquet: bool = False) -> None:
+    shape = 2048
+    sparsity = arange(0, 1, 0.1)
     runs = [f"run_{run:02}" for run in range(1, 10 + 1)]
     header = [*ArrayInfo.header(), *runs]
-    csv_writer("benchmark_numpy_sparsity_2d", header, data)
+    data = _sparsity_2d(shape, sparsity, repeats=10, iterations=20)
+    write_results("benchmark_numpy_sparsity_2d", header, data, parquet=parquet)
 
 
 if __name__ == "__main__":
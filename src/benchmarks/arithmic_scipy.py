@@ -1,16 +1,30 @@
 import sys
-from timeit import Timer
+from functools import partial
+from typing import Any, Iterator, Sequence, Tuple
 
 from numpy import arange, dtype
 from numpy.random import default_rng
 from scipy.sparse import csr_array, random
 
+try:
+    from scipy.sparse import random_array
+except ImportError:  # SciPy < 1.11
+    _random_array_available = False
+    random_array = None
+else:
+    _random_array_available = True
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
-from benchmarks.abstract import AbstractArrayInfo, csv_writer
+from benchmarks.abstract import (
+    AbstractArrayInfo,
+    pin_cpu,
+    run_benchmark,
+    write_results,
+)
 
 
 class CSRArrayInfo(AbstractArrayInfo[csr_array]):
@@ -24,7 +38,7 @@ class CSRArrayInfo(AbstractArrayInfo[csr_array]):
 
     @classmethod
     def nbytes(cls: Self, array: csr_array) -> int:
-        return array.data.nbytes
+        return array.data.nbytes + array.indices.nbytes + array.indptr.nbytes
 
     @classmethod
     def itemsize(cls: Self, array: csr_array) -> int:
@@ -39,30 +53,48 @@ class CSRArrayInfo(AbstractArrayInfo[csr_array]):
         return array.nnz
 
 
-def benchmark_sparsity_2d():
-    shape = 2048
-    densities = arange(0, 1 + 0.1, 0.1)
-    setup = "import scipy.sparse as cs; import numpy as np; array = cs.csr_array(cs.random({shape}, {shape}, density={density}, format='csr', dtype='float64', random_state=np.random.default_rng(1)))"
-    stmt = "array.dot(array)"
-    data = []
+def _random_csr(shape: int, density: float) -> csr_array:
+    if _random_array_available:
+        return random_array(
+            (shape, shape),
+            density=density,
+            format="csr",
+            dtype="float64",
+            random_state=default_rng(1),
+        )
+    return csr_array(
+        random(
+            shape,
+            shape,
+            density=density,
+            format="csr",
+            dtype="float64",
+            random_state=default_rng(1),
+        )
+    )
+
+
+def _sparsity_2d(
+    shape: int, densities: Sequence[float], repeats: int, iterations: int
+) -> Iterator[Tuple[Any, ...]]:
     for density in densities:
-        timer = Timer(stmt, setup.format(density=density, shape=shape))
-        timings = timer.repeat(repeat=10, number=10)
-        array = csr_array(
-            random(
-                shape,
-                shape,
-                density=density,
-                format="csr",
-                dtype="float64",
-                random_state=default_rng(1),
-            )
+        array = _random_csr(shape, density)
+        timings = run_benchmark(
+            partial(array.dot, array), repeat=repeats, number=iterations
         )
-        data.append(*CSRArrayInfo.as_tuple(array), *timings)
+        yield (*CSRArrayInfo.as_tuple(array), *timings)
+
+
+def benchmark_sparsity_2d(parquet: bool = False) -> None:
+    shape = 2048
+    densities = arange(0, 1 + 0.1, 0.1)
     runs = [f"run_{run:02}" for run in range(1, 10 + 1)]
     header = [*CSRArrayInfo.header(), *runs]
-    csv_writer("benchmark_scipy_sparsity_2d", header, data)
+    data = _sparsity_2d(shape, densities, repeats=10, iterations=10)
+    write_results("benchmark_scipy_sparsity_2d", header, data, parquet=parquet)
 
 
 if __name__ == "__main__":
+    pinned = pin_cpu()
+    print(f"Pinned to CPU {pinned}" if pinned is not None else "Not pinned")
     benchmark_sparsity_2d()